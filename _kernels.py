@@ -0,0 +1,329 @@
+"""
+Numba kernels for the candlestick predicates in ``patterns``.
+
+Each ``_*_nb`` kernel takes raw float64 OHLC scalars instead of a
+``CandleStick`` and mirrors the logic of its public counterpart exactly.
+The ``scan_*`` functions apply a kernel to every bar of OHLC arrays and
+return a boolean mask aligned with the input.
+"""
+import inspect
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .entity import (DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                     DEFAULT_BELT_HOLD_MIN_BODY_RATIO, PRICE_REL_TOL, PRICE_ABS_TOL)
+from .utils._njit import njit, prange, vectorize
+
+
+# --- Scalar kernels ---
+@njit(cache=True)
+def _close_nb(a, b, rel_tol, abs_tol):
+    """Same tolerance rule as ``math.isclose``.
+
+    The tolerances are arguments, not defaults or ``entity`` globals: the on-disk
+    cache of a caller would keep them frozen at their first compiled value.
+    """
+    if a == b:
+        return True
+    if math.isinf(a) or math.isinf(b):
+        return False
+    return abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+
+@njit(cache=True)
+def _doji_nb(o, h, l, c, max_body_ratio):
+    length = h - l
+    return length > 0 and abs(c - o) / length <= max_body_ratio
+
+@njit(cache=True)
+def _hammer_nb(o, h, l, c, max_body_ratio, min_lower_wick_to_body, max_upper_wick_ratio):
+    length = h - l
+    if length <= 0:
+        return False
+    # Most selective compare first; the divide runs only for survivors.
+    body = abs(c - o)
+    if min(o, c) - l < body * min_lower_wick_to_body:
+        return False
+    return (h - max(o, c) <= max_upper_wick_ratio * length
+            and body / length <= max_body_ratio)
+
+@njit(cache=True)
+def _shooting_star_nb(o, h, l, c, max_body_ratio, min_upper_wick_to_body, max_lower_wick_ratio):
+    length = h - l
+    if length <= 0:
+        return False
+    body = abs(c - o)
+    if h - max(o, c) < body * min_upper_wick_to_body:
+        return False
+    return (min(o, c) - l <= max_lower_wick_ratio * length
+            and body / length <= max_body_ratio)
+
+@njit(cache=True)
+def _bullish_belt_hold_nb(o, h, l, c, min_body_ratio, rel_tol, abs_tol):
+    length = h - l
+    if length <= 0 or c <= o:
+        return False
+    return (_close_nb(o, l, rel_tol, abs_tol)
+            and _close_nb(c, h, rel_tol, abs_tol)
+            and (c - o) / length >= min_body_ratio)
+
+@njit(cache=True)
+def _bearish_belt_hold_nb(o, h, l, c, min_body_ratio, rel_tol, abs_tol):
+    length = h - l
+    if length <= 0 or c > o:
+        return False
+    return (_close_nb(o, h, rel_tol, abs_tol)
+            and _close_nb(c, l, rel_tol, abs_tol)
+            and (o - c) / length >= min_body_ratio)
+
+
+# --- Bulk scanners ---
+@njit(cache=True, parallel=True)
+def scan_doji(O, H, L, C, max_body_ratio=DEFAULT_DOJI_MAX_BODY_RATIO):
+    """Boolean mask of Doji bars over OHLC arrays."""
+    n = O.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        out[i] = _doji_nb(O[i], H[i], L[i], C[i], max_body_ratio)
+    return out
+
+@njit(cache=True, parallel=True)
+def scan_hammer(O, H, L, C,
+                max_body_ratio=DEFAULT_HAMMER_MAX_BODY_RATIO,
+                min_lower_wick_to_body=DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                max_upper_wick_ratio=DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Boolean mask of Hammer bars over OHLC arrays."""
+    n = O.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        out[i] = _hammer_nb(O[i], H[i], L[i], C[i], max_body_ratio,
+                            min_lower_wick_to_body, max_upper_wick_ratio)
+    return out
+
+@njit(cache=True, parallel=True)
+def scan_shooting_star(O, H, L, C,
+                       max_body_ratio=DEFAULT_HAMMER_MAX_BODY_RATIO,
+                       min_upper_wick_to_body=DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                       max_lower_wick_ratio=DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Boolean mask of Shooting Star bars over OHLC arrays."""
+    n = O.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        out[i] = _shooting_star_nb(O[i], H[i], L[i], C[i], max_body_ratio,
+                                   min_upper_wick_to_body, max_lower_wick_ratio)
+    return out
+
+@njit(cache=True, parallel=True)
+def scan_bullish_belt_hold(O, H, L, C, min_body_ratio=DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+                           rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL):
+    """Boolean mask of Bullish Belt Hold bars over OHLC arrays."""
+    n = O.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        out[i] = _bullish_belt_hold_nb(O[i], H[i], L[i], C[i], min_body_ratio, rel_tol, abs_tol)
+    return out
+
+@njit(cache=True, parallel=True)
+def scan_bearish_belt_hold(O, H, L, C, min_body_ratio=DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+                           rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL):
+    """Boolean mask of Bearish Belt Hold bars over OHLC arrays."""
+    n = O.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        out[i] = _bearish_belt_hold_nb(O[i], H[i], L[i], C[i], min_body_ratio, rel_tol, abs_tol)
+    return out
+
+
+# --- Ufuncs ---
+# Broadcasting NumPy ufuncs over the scalar kernels; thresholds broadcast too
+# and ``out=`` buffers are supported. Ufuncs take no defaults, so the belt holds
+# take the price tolerances explicitly (pass ``entity.PRICE_REL_TOL``/``PRICE_ABS_TOL``).
+# Signatures: the four OHLC prices plus one or three float64 thresholds/tolerances.
+_SIG_OHLC_1THR = ["boolean(float64, float64, float64, float64, float64)"]
+_SIG_OHLC_3THR = ["boolean(float64, float64, float64, float64, float64, float64, float64)"]
+
+@vectorize(_SIG_OHLC_1THR, target="parallel", cache=True)
+def doji_u(o, h, l, c, max_body_ratio):
+    return _doji_nb(o, h, l, c, max_body_ratio)
+
+@vectorize(_SIG_OHLC_3THR, target="parallel", cache=True)
+def hammer_u(o, h, l, c, max_body_ratio, min_lower_wick_to_body, max_upper_wick_ratio):
+    return _hammer_nb(o, h, l, c, max_body_ratio, min_lower_wick_to_body, max_upper_wick_ratio)
+
+@vectorize(_SIG_OHLC_3THR, target="parallel", cache=True)
+def shooting_star_u(o, h, l, c, max_body_ratio, min_upper_wick_to_body, max_lower_wick_ratio):
+    return _shooting_star_nb(o, h, l, c, max_body_ratio, min_upper_wick_to_body, max_lower_wick_ratio)
+
+@vectorize(_SIG_OHLC_3THR, target="parallel", cache=True)
+def bullish_belt_hold_u(o, h, l, c, min_body_ratio, rel_tol, abs_tol):
+    return _bullish_belt_hold_nb(o, h, l, c, min_body_ratio, rel_tol, abs_tol)
+
+@vectorize(_SIG_OHLC_3THR, target="parallel", cache=True)
+def bearish_belt_hold_u(o, h, l, c, min_body_ratio, rel_tol, abs_tol):
+    return _bearish_belt_hold_nb(o, h, l, c, min_body_ratio, rel_tol, abs_tol)
+
+
+# --- Fused scanner ---
+# Row order of ``out_masks`` in ``scan_all_patterns``.
+PATTERN_NAMES = (
+    "doji",
+    "hammer",
+    "shooting_star",
+    "bullish_belt_hold",
+    "bearish_belt_hold",
+)
+
+@njit(cache=True, parallel=True)
+def scan_all_patterns(O, H, L, C, out_masks, doji_max_body_ratio, max_body_ratio,
+                      min_wick_to_body, max_opposite_wick_ratio, belt_hold_min_body_ratio,
+                      rel_tol, abs_tol):
+    """Evaluate every pattern in one pass over OHLC arrays.
+
+    Per-bar geometry is computed once and shared by all patterns. Thresholds and
+    price tolerances are arguments rather than globals: the on-disk cache only tracks this file, so
+    constants read from ``entity`` would stay frozen at their first compiled value.
+    :param out_masks: Boolean array of shape ``(len(PATTERN_NAMES), n)``, filled in place
+    """
+    n = O.shape[0]
+    for i in prange(n):
+        o = O[i]
+        h = H[i]
+        l = L[i]
+        c = C[i]
+        ln = h - l
+        if ln <= 0:
+            for k in range(out_masks.shape[0]):
+                out_masks[k, i] = False
+            continue
+        bl = abs(c - o)
+        br = bl / ln
+        bull = c > o
+        top = h - max(o, c)
+        bot = min(o, c) - l
+        out_masks[0, i] = br <= doji_max_body_ratio
+        thin = br <= max_body_ratio
+        long_wick = bl * min_wick_to_body
+        short_wick = max_opposite_wick_ratio * ln
+        thick = br >= belt_hold_min_body_ratio
+        out_masks[1, i] = thin and bot >= long_wick and top <= short_wick
+        out_masks[2, i] = thin and top >= long_wick and bot <= short_wick
+        out_masks[3, i] = (bull and thick and _close_nb(o, l, rel_tol, abs_tol)
+                           and _close_nb(c, h, rel_tol, abs_tol))
+        out_masks[4, i] = (not bull and thick and _close_nb(o, h, rel_tol, abs_tol)
+                           and _close_nb(c, l, rel_tol, abs_tol))
+
+def scan_all(O: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray) -> dict[str, np.ndarray]:
+    """Evaluate every pattern, with default thresholds, in one fused pass.
+
+    The masks are rows of one ``(len(PATTERN_NAMES), n)`` buffer, so each is contiguous.
+    :return: Mapping of pattern name to boolean mask
+    """
+    out = np.empty((len(PATTERN_NAMES), O.shape[0]), dtype=np.bool_)
+    scan_all_patterns(O, H, L, C, out, DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                      DEFAULT_HAMMER_MIN_WICK_TO_BODY, DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                      DEFAULT_BELT_HOLD_MIN_BODY_RATIO, PRICE_REL_TOL, PRICE_ABS_TOL)
+    return dict(zip(PATTERN_NAMES, out))
+
+
+# Row order of the masks produced by ``scan_mirror_pairs``.
+MIRROR_PAIR_NAMES = (
+    "hammer",
+    "shooting_star",
+    "bullish_belt_hold",
+    "bearish_belt_hold",
+)
+
+@njit(cache=True, parallel=True)
+def _scan_mirror_pairs_nb(O, H, L, C, max_body_ratio, min_wick_to_body,
+                          max_opposite_wick_ratio, min_belt_body_ratio, rel_tol, abs_tol, out):
+    n = O.shape[0]
+    for i in prange(n):
+        o = O[i]
+        h = H[i]
+        l = L[i]
+        c = C[i]
+        ln = h - l
+        if ln <= 0:
+            for k in range(out.shape[0]):
+                out[k, i] = False
+            continue
+        bl = abs(c - o)
+        br = bl / ln
+        top = h - max(o, c)
+        bot = min(o, c) - l
+        thin = br <= max_body_ratio
+        opposite = max_opposite_wick_ratio * ln
+        out[0, i] = thin and bot >= bl * min_wick_to_body and top <= opposite
+        out[1, i] = thin and top >= bl * min_wick_to_body and bot <= opposite
+        thick = br >= min_belt_body_ratio
+        if c > o:
+            out[2, i] = thick and _close_nb(o, l, rel_tol, abs_tol) and _close_nb(c, h, rel_tol, abs_tol)
+            out[3, i] = False
+        else:
+            out[2, i] = False
+            out[3, i] = thick and _close_nb(o, h, rel_tol, abs_tol) and _close_nb(c, l, rel_tol, abs_tol)
+
+def scan_mirror_pairs(O: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray,
+                      max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                      min_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                      max_opposite_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                      min_belt_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> dict[str, np.ndarray]:
+    """Scan the bullish/bearish mirror pairs (Hammer/Shooting Star, Belt Holds) in one pass.
+
+    Both sides of each pair share the same per-bar geometry.
+    :param max_body_ratio: Hammer/Shooting Star maximum body-to-total-length ratio
+    :param min_wick_to_body: Hammer/Shooting Star minimum long-wick to body ratio
+    :param max_opposite_wick_ratio: Hammer/Shooting Star maximum short wick as fraction of length
+    :param min_belt_body_ratio: Belt Hold minimum body-to-total-length ratio
+    :return: Mapping of pattern name to boolean mask
+    """
+    out = np.empty((len(MIRROR_PAIR_NAMES), O.shape[0]), dtype=np.bool_)
+    _scan_mirror_pairs_nb(O, H, L, C, max_body_ratio, min_wick_to_body,
+                          max_opposite_wick_ratio, min_belt_body_ratio, PRICE_REL_TOL, PRICE_ABS_TOL, out)
+    return dict(zip(MIRROR_PAIR_NAMES, out))
+
+
+# --- Threshold-specialized scanners ---
+# pattern name -> (scalar kernel, generic scanner supplying threshold names and defaults)
+_SPECIALIZABLE = {
+    "doji": (_doji_nb, scan_doji),
+    "hammer": (_hammer_nb, scan_hammer),
+    "shooting_star": (_shooting_star_nb, scan_shooting_star),
+    "bullish_belt_hold": (_bullish_belt_hold_nb, scan_bullish_belt_hold),
+    "bearish_belt_hold": (_bearish_belt_hold_nb, scan_bearish_belt_hold),
+}
+
+# Bounded: each entry holds a compiled kernel, and threshold sets can be unbounded.
+@lru_cache(maxsize=256)
+def _specialize(kernel, consts: tuple):
+    @njit(parallel=True)
+    def scan(O, H, L, C):
+        n = O.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            out[i] = kernel(O[i], H[i], L[i], C[i], *consts)
+        return out
+    return scan
+
+def make_scanner(pattern_name: str, **thresholds: float):
+    """Build a ``scan(O, H, L, C)`` function with the thresholds baked in as constants.
+
+    Under Numba the thresholds are frozen into the compiled loop, so the compares
+    fold to immediates. Thresholds not given take the defaults of the matching
+    ``scan_*`` function. The 256 most recent pattern and threshold sets stay memoized.
+    :param pattern_name: One of the keys of ``_SPECIALIZABLE``, e.g. ``"hammer"``
+    :param thresholds: Keyword thresholds of the matching ``scan_*`` function
+    """
+    try:
+        kernel, generic = _SPECIALIZABLE[pattern_name]
+    except KeyError:
+        raise ValueError(f"Unknown pattern: {pattern_name!r}") from None
+    params = list(inspect.signature(getattr(generic, "py_func", generic)).parameters.values())[4:]
+    unknown = set(thresholds) - {p.name for p in params}
+    if unknown:
+        raise TypeError(f"Unknown thresholds for {pattern_name!r}: {sorted(unknown)}")
+    consts = tuple(float(thresholds.get(p.name, p.default)) for p in params)
+    return _specialize(kernel, consts)
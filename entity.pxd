@@ -0,0 +1,7 @@
+# Cython declarations for compiling entity.py in pure-Python mode.
+
+cdef class CandleStick:
+    cdef readonly double open, high, low, close
+    cdef readonly double body_length, length, body_ratio, body_average
+    cdef readonly double body_high, body_low, top_wick, bottom_wick
+    cdef readonly bint is_bullish
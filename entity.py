@@ -1,10 +1,67 @@
+from functools import cached_property
+
+import numpy as np
+
+try:
+    import cython
+    _COMPILED = cython.compiled
+except ImportError:  # plain-Python install without Cython
+    _COMPILED = False
+
+# Default pattern thresholds shared by the scalar predicates in ``patterns``, the
+# series masks and the compiled scanners, so every path agrees on one set of values.
+DEFAULT_DOJI_MAX_BODY_RATIO = 0.1
+DEFAULT_HAMMER_MAX_BODY_RATIO = 0.25
+DEFAULT_HAMMER_MIN_WICK_TO_BODY = 2.0
+DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO = 0.33
+DEFAULT_BELT_HOLD_MIN_BODY_RATIO = 0.95
+
+# Tolerance (math.isclose rel_tol/abs_tol) for two prices counting as the same level,
+# e.g. a belt hold's open on its low; used by every path the same way.
+PRICE_REL_TOL = 1e-4
+PRICE_ABS_TOL = 1e-5
+
+# Bit flags packed per bar by CandleSeries.feature_bits
+FEATURE_VALID = 1 << 0      # non-zero range
+FEATURE_BULLISH = 1 << 1    # close > open
+FEATURE_THICK = 1 << 2      # body_ratio >= min_body_ratio
+FEATURE_THIN = 1 << 3       # body_ratio <= max_body_ratio
+FEATURE_GAP_UP = 1 << 4     # open > previous close
+FEATURE_GAP_DOWN = 1 << 5   # open < previous close
+
+_RELATION_OPS = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '==': np.equal,
+}
+
+
+def _price_close(a: np.ndarray, b: np.ndarray, rel_tol: float = PRICE_REL_TOL,
+                 abs_tol: float = PRICE_ABS_TOL) -> np.ndarray:
+    """Elementwise math.isclose with the price tolerance used by the belt-hold patterns."""
+    diff = np.subtract(a, b)
+    np.abs(diff, out=diff)
+    tol = np.maximum(np.abs(a), np.abs(b)) * rel_tol
+    np.maximum(tol, abs_tol, out=tol)
+    # As in math.isclose, an infinite price is close only to itself
+    return ((diff <= tol) & np.isfinite(diff)) | (a == b)
 
 
 class CandleStick:
     """
     Represents a single candlestick extracted from a pandas DataFrame.
+
+    Derived geometry is computed once at construction and stored in slots, so the
+    candle is immutable: assigning any field raises AttributeError, as in the
+    compiled build.
     """
 
+    __slots__ = ("open", "high", "low", "close",
+                 "body_length", "length", "body_ratio", "body_average",
+                 "body_high", "body_low", "top_wick", "bottom_wick", "is_bullish")
+
     def __init__(self, df, index: int):
         """
         Initialize by extracting OHLC values from the DataFrame at the given index.
@@ -13,46 +70,376 @@ class CandleStick:
         :param index: integer row index
         """
         row = df.iloc[index]
-        self.open = float(row['Open'])
-        self.high = float(row['High'])
-        self.low = float(row['Low'])
-        self.close = float(row['Close'])
+        self._set(float(row['Open']), float(row['High']), float(row['Low']), float(row['Close']))
+
+    @classmethod
+    def from_ohlc(cls, open: float, high: float, low: float, close: float) -> "CandleStick":
+        """
+        Build a candlestick directly from OHLC values.
+
+        :param open: Open price
+        :param high: High price
+        :param low: Low price
+        :param close: Close price
+        """
+        candle = cls.__new__(cls)
+        candle._set(float(open), float(high), float(low), float(close))
+        return candle
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CandleStick is immutable; cannot set {name!r} "
+                             "(derived fields would go stale); build a new one with from_ohlc()")
+
+    def _set(self, o: float, h: float, l: float, c: float):
+        body_high = c if c > o else o
+        body_low = c if c < o else o
+        body_length = abs(c - o)
+        length = h - l
+        body_ratio = body_length / length if length != 0 else 0.0
+        cls = type(self)
+        if not _COMPILED:
+            # Swap to a writable twin with the same slots for the stores below; the
+            # compiled build writes its C fields directly
+            object.__setattr__(self, "__class__", _WritableCandleStick)
+        self.open = o
+        self.high = h
+        self.low = l
+        self.close = c
+        self.body_length = body_length
+        self.length = length
+        self.body_ratio = body_ratio
+        self.body_average = (o + c) / 2
+        self.body_high = body_high
+        self.body_low = body_low
+        self.top_wick = h - body_high
+        self.bottom_wick = body_low - l
+        self.is_bullish = c > o
+        if not _COMPILED:
+            self.__class__ = cls
+
+
+if not _COMPILED:
+    class _WritableCandleStick(CandleStick):
+        """CandleStick slot layout with ordinary assignment; only used inside ``_set``."""
+        __slots__ = ()
+        __setattr__ = object.__setattr__
+
+
+class CandleSeries:
+    """
+    Struct-of-arrays view over a run of candlesticks.
+
+    Holds OHLC as contiguous columns (float64 by default); derived columns are
+    computed once, vectorially, on first access and cached in the same dtype.
+    """
+
+    def __init__(self, df, dtype=np.float64):
+        """
+        Initialize by extracting OHLC columns from the DataFrame.
+
+        :param df: pandas DataFrame with columns 'Open', 'High', 'Low', 'Close'
+        :param dtype: column dtype; np.float32 halves memory traffic for large scans
+        """
+        self.dtype = np.dtype(dtype)
+        self.open = self._column(df['Open'])
+        self.high = self._column(df['High'])
+        self.low = self._column(df['Low'])
+        self.close = self._column(df['Close'])
+        self._feature_cache = {}
+
+    def _column(self, values) -> np.ndarray:
+        return np.ascontiguousarray(values, dtype=self.dtype)
+
+    @classmethod
+    def from_arrays(cls, open, high, low, close, **kwargs) -> "CandleSeries":
+        """
+        Build a series directly from OHLC array-likes.
+
+        :param open: Open prices
+        :param high: High prices
+        :param low: Low prices
+        :param close: Close prices
+        :param kwargs: forwarded to the constructor (e.g. dtype)
+        """
+        return cls({'Open': open, 'High': high, 'Low': low, 'Close': close}, **kwargs)
 
-    @property
-    def top_wick(self) -> float:
-        return self.high - max(self.open, self.close)
+    def __len__(self) -> int:
+        return self.open.shape[0]
 
-    @property
-    def bottom_wick(self) -> float:
-        return min(self.open, self.close) - self.low
+    def slice(self, i: int) -> CandleStick:
+        """
+        Materialize bar ``i`` as a CandleStick for the scalar API.
+
+        :param i: Bar index
+        """
+        return CandleStick.from_ohlc(self.open[i], self.high[i], self.low[i], self.close[i])
 
-    @property
-    def body_length(self) -> float:
-        return abs(self.open - self.close)
+    @cached_property
+    def top_wick(self) -> np.ndarray:
+        return self.high - self.body_high
 
-    @property
-    def body_average(self) -> float:
+    @cached_property
+    def bottom_wick(self) -> np.ndarray:
+        return self.body_low - self.low
+
+    @cached_property
+    def body_length(self) -> np.ndarray:
+        return self.body_high - self.body_low
+
+    @cached_property
+    def body_average(self) -> np.ndarray:
         return (self.open + self.close) / 2
 
-    @property
-    def length(self) -> float:
+    @cached_property
+    def length(self) -> np.ndarray:
         return self.high - self.low
 
-    @property
-    def is_bullish(self) -> bool:
+    @cached_property
+    def is_bullish(self) -> np.ndarray:
         return self.close > self.open
 
-    @property
-    def body_ratio(self) -> float:
-        if self.length == 0:
-            return 0
-        return self.body_length / self.length
+    @cached_property
+    def body_ratio(self) -> np.ndarray:
+        length = self.length
+        out = np.zeros(length.shape, dtype=np.result_type(length.dtype, np.float32))
+        return np.divide(self.body_length, length, out=out, where=length != 0)
+
+    @cached_property
+    def body_low(self) -> np.ndarray:
+        return np.minimum(self.open, self.close)
+
+    @cached_property
+    def body_high(self) -> np.ndarray:
+        return np.maximum(self.open, self.close)
+
+    # Price-level coincidences (within _price_close tolerance), computed once
+    @cached_property
+    def open_at_low(self) -> np.ndarray:
+        return _price_close(self.open, self.low)
+
+    @cached_property
+    def open_at_high(self) -> np.ndarray:
+        return _price_close(self.open, self.high)
+
+    @cached_property
+    def close_at_high(self) -> np.ndarray:
+        return _price_close(self.close, self.high)
+
+    @cached_property
+    def close_at_low(self) -> np.ndarray:
+        return _price_close(self.close, self.low)
 
-    @property
-    def body_low(self) -> float:
-        return self.close if self.close < self.open else self.open
+    def scaled(self, column: str, factor: float) -> np.ndarray:
+        """
+        Cached ``column * factor``, e.g. the wick limit ``length * 0.33``.
+
+        Mirror patterns compare against the same products (Hammer and Shooting Star
+        both use ``body_length * 2.0`` and ``length * 0.33``), so each is built once.
+
+        :param column: attribute name, e.g. 'length' or 'body_length'
+        :param factor: multiplier
+        """
+        key = ('scaled', column, factor)
+        out = self._feature_cache.get(key)
+        if out is None:
+            out = getattr(self, column) * factor
+            self._feature_cache[key] = out
+        return out
+
+    def relation(self, column: str, op: str, prev_column: str, lag: int = 1) -> np.ndarray:
+        """
+        Cached comparison of each bar against an earlier bar.
+
+        Element i is ``column[i] <op> prev_column[i - lag]``; the first ``lag`` bars
+        have no earlier bar and are False. Patterns share these columns instead of
+        repeating the same adjacent-bar comparisons.
+
+        :param column: attribute of the current bar, e.g. 'open' or 'body_high'
+        :param op: one of '<', '<=', '>', '>=', '=='
+        :param prev_column: attribute of the earlier bar
+        :param lag: how many bars back the earlier bar is (>= 1)
+        """
+        key = ('relation', column, op, prev_column, lag)
+        out = self._feature_cache.get(key)
+        if out is None:
+            if lag < 1:
+                raise ValueError(f"lag must be >= 1, got {lag}")
+            if op not in _RELATION_OPS:
+                raise ValueError(f"op must be one of {sorted(_RELATION_OPS)}, got {op!r}")
+            compare = _RELATION_OPS[op]
+            out = np.zeros(len(self), dtype=bool)
+            compare(getattr(self, column)[lag:], getattr(self, prev_column)[:-lag], out=out[lag:])
+            out.setflags(write=False)
+            self._feature_cache[key] = out
+        return out
+
+    # Two-candle relations: element i compares bar i (current) with bar i-1
+    # (previous); element 0 has no previous bar and is False.
+    @cached_property
+    def gap_up(self) -> np.ndarray:
+        return self.relation('open', '>', 'close')
+
+    @cached_property
+    def gap_down(self) -> np.ndarray:
+        return self.relation('open', '<', 'close')
+
+    @cached_property
+    def body_engulf(self) -> np.ndarray:
+        return (self.relation('body_high', '>', 'body_high')
+                & self.relation('body_low', '<', 'body_low'))
+
+    @cached_property
+    def wick_engulf(self) -> np.ndarray:
+        return self.relation('high', '>', 'high') & self.relation('low', '<', 'low')
+
+    @cached_property
+    def body_contained(self) -> np.ndarray:
+        return (self.relation('body_high', '<=', 'body_high')
+                & self.relation('body_low', '>=', 'body_low'))
+
+    @cached_property
+    def _base_feature_bits(self) -> np.ndarray:
+        """Threshold-independent FEATURE_* bits, shared by every feature_bits() key."""
+        feats = (self.length > 0).view(np.uint8).copy()
+        feats |= self.is_bullish.view(np.uint8) << 1
+        feats |= self.gap_up.view(np.uint8) << 4
+        feats |= self.gap_down.view(np.uint8) << 5
+        return feats
+
+    def feature_bits(self, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+                     max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO) -> np.ndarray:
+        """
+        Pack the single-bit predicates of every bar into one uint8 per bar.
+
+        Results are cached per threshold pair and returned read-only.
+
+        :param min_body_ratio: Threshold for FEATURE_THICK
+        :param max_body_ratio: Threshold for FEATURE_THIN
+        :return: uint8 array of FEATURE_* flags
+        """
+        key = (min_body_ratio, max_body_ratio)
+        feats = self._feature_cache.get(key)
+        if feats is None:
+            br = self.body_ratio
+            feats = self._base_feature_bits.copy()
+            feats |= (br >= min_body_ratio).view(np.uint8) << 2
+            feats |= (br <= max_body_ratio).view(np.uint8) << 3
+            feats.setflags(write=False)
+            self._feature_cache[key] = feats
+        return feats
+
+    def predicate_cache(self, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+                        max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO) -> dict:
+        """
+        Boolean columns of the reusable per-bar predicates for one threshold pair.
 
-    @property
-    def body_high(self) -> float:
-        return self.close if self.close > self.open else self.open
+        Built once from feature_bits and cached, so screening many patterns over the
+        same thresholds compares body ratios only once per bar; the ``*_mask`` scans in
+        ``patterns`` read their direction and body checks from here. The columns are
+        shared and therefore read-only.
 
+        :param min_body_ratio: Threshold for the thick columns
+        :param max_body_ratio: Threshold for the thin columns
+        :return: dict with 'valid', 'bullish', 'bearish', 'thick', 'thin', 'thick_bullish',
+            'thick_bearish', 'thin_bullish', 'thin_bearish', 'gap_up', 'gap_down'
+        """
+        key = ("predicates", min_body_ratio, max_body_ratio)
+        cache = self._feature_cache.get(key)
+        if cache is None:
+            feats = self.feature_bits(min_body_ratio, max_body_ratio)
+            valid = (feats & FEATURE_VALID) != 0
+            bullish = (feats & FEATURE_BULLISH) != 0
+            bearish = ~bullish
+            thick = (feats & FEATURE_THICK) != 0
+            thin = (feats & FEATURE_THIN) != 0
+            cache = {
+                'valid': valid,
+                'bullish': bullish,
+                'bearish': bearish,
+                'thick': thick,
+                'thin': thin,
+                'thick_bullish': thick & bullish,
+                'thick_bearish': thick & bearish,
+                'thin_bullish': thin & bullish,
+                'thin_bearish': thin & bearish,
+                'gap_up': self.gap_up,
+                'gap_down': self.gap_down,
+            }
+            # Shared by every mask that asks for these thresholds; keep them immutable
+            for column in cache.values():
+                column.setflags(write=False)
+            self._feature_cache[key] = cache
+        return cache
+
+class CandleSeriesFixed(CandleSeries):
+    """
+    CandleSeries storing prices as int32 tick counts.
+
+    Candle geometry only compares and subtracts prices, which is order-preserving
+    on ticks, so integer columns give the same answers at half the width of float64.
+    """
+
+    def __init__(self, df, tick_size: float = 1e-4):
+        """
+        Initialize by quantizing OHLC columns from the DataFrame to ticks.
+
+        :param df: pandas DataFrame with columns 'Open', 'High', 'Low', 'Close'
+        :param tick_size: price of one tick; prices are rounded to the nearest tick
+        """
+        self.tick_size = tick_size
+        super().__init__(df, dtype=np.int32)
+
+    @classmethod
+    def from_ticks(cls, open, high, low, close, tick_size: float) -> "CandleSeriesFixed":
+        """
+        Build a series from OHLC already expressed as integer tick counts.
+
+        Skips the float round trip of the DataFrame constructor.
+
+        :param open: Open prices in ticks
+        :param high: High prices in ticks
+        :param low: Low prices in ticks
+        :param close: Close prices in ticks
+        :param tick_size: price of one tick
+        """
+        series = cls.__new__(cls)
+        series.tick_size = tick_size
+        series.dtype = np.dtype(np.int32)
+        series.open, series.high, series.low, series.close = (
+            cls._tick_column(col) for col in (open, high, low, close))
+        series._feature_cache = {}
+        return series
+
+    @staticmethod
+    def _tick_column(values) -> np.ndarray:
+        ticks = np.asarray(values)
+        if ticks.dtype.kind not in 'iu':
+            raise TypeError(f"tick columns must be integers, got {ticks.dtype}")
+        info = np.iinfo(np.int32)
+        if ticks.size and (ticks.min() < info.min or ticks.max() > info.max):
+            raise ValueError("tick counts overflow int32")
+        return np.ascontiguousarray(ticks, dtype=np.int32)
+
+    def _column(self, values) -> np.ndarray:
+        ticks = np.rint(np.asarray(values, dtype=np.float64) / self.tick_size)
+        if not np.isfinite(ticks).all():
+            # A cast would turn NaN/inf into arbitrary ticks that look like real prices
+            raise ValueError("prices must be finite to quantize to ticks")
+        if ticks.size and np.abs(ticks).max() > np.iinfo(np.int32).max:
+            raise ValueError("prices overflow int32 ticks; use a larger tick_size")
+        return np.ascontiguousarray(ticks, dtype=np.int32)
+
+    @cached_property
+    def body_average(self) -> np.ndarray:
+        # Widen first: open + close overflows int32 once prices pass half the tick range
+        return (self.open.astype(np.int64) + self.close) / 2
+
+    def slice(self, i: int) -> CandleStick:
+        """
+        Materialize bar ``i`` as a CandleStick, converting ticks back to prices.
+
+        :param i: Bar index
+        """
+        t = self.tick_size
+        return CandleStick.from_ohlc(self.open[i] * t, self.high[i] * t,
+                                     self.low[i] * t, self.close[i] * t)
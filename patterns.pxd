@@ -0,0 +1,27 @@
+# Cython declarations for compiling patterns.py in pure-Python mode.
+
+from .entity cimport CandleStick
+
+cpdef bint is_thick_enough(CandleStick candle, double min_ratio)
+cpdef bint is_thick_bearish(CandleStick candle, double min_ratio)
+cpdef bint is_thick_bullish(CandleStick candle, double min_ratio)
+cpdef bint is_thin_enough(CandleStick candle, double max_ratio)
+cpdef bint is_thin_bearish(CandleStick candle, double max_ratio)
+cpdef bint is_thin_bullish(CandleStick candle, double max_ratio)
+cpdef bint gap_down(CandleStick prev, CandleStick curr)
+cpdef bint gap_up(CandleStick prev, CandleStick curr)
+cpdef bint body_engulf(CandleStick prev, CandleStick curr)
+cpdef bint wick_engulf(CandleStick prev, CandleStick curr)
+cpdef bint body_contained(CandleStick inner, CandleStick outer)
+
+cpdef bint is_doji(CandleStick candle, double max_body_ratio=*)
+cpdef bint is_hammer(CandleStick candle,
+                     double max_body_ratio=*,
+                     double min_lower_wick_to_body=*,
+                     double max_upper_wick_ratio=*)
+cpdef bint is_shooting_star(CandleStick candle,
+                            double max_body_ratio=*,
+                            double min_upper_wick_to_body=*,
+                            double max_lower_wick_ratio=*)
+cpdef bint is_bullish_belt_hold(CandleStick candle, double min_body_ratio=*)
+cpdef bint is_bearish_belt_hold(CandleStick candle, double min_body_ratio=*)
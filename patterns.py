@@ -1,5 +1,11 @@
-from .entity import CandleStick
-import math
+from .entity import (CandleStick, CandleSeries,
+                     DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                     DEFAULT_BELT_HOLD_MIN_BODY_RATIO, PRICE_REL_TOL, PRICE_ABS_TOL)
+from math import isclose
+from types import SimpleNamespace
+import numpy as np
 
 # --- Shared helpers ---
 def is_thick_enough(candle: CandleStick, min_ratio: float) -> bool:
@@ -79,28 +85,22 @@ def body_contained(inner: CandleStick, outer: CandleStick) -> bool:
     """
     return inner.body_high <= outer.body_high and inner.body_low >= outer.body_low
 
-def _valid_candle(candle: CandleStick) -> bool:
-    return candle.length > 0
-
-def _rel_close(a: float, b: float, rel_tol: float = 1e-4, abs_tol: float = 1e-8) -> bool:
-    return math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
-
 # --------------------------
 # SINGLE-CANDLE PATTERNS (Nison - Japanese Candlestick Charting Techniques, 2nd Ed.)
 # --------------------------
 
-def is_doji(candle: CandleStick, max_body_ratio: float = 0.1) -> bool:
+def is_doji(candle: CandleStick, max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO) -> bool:
     """Detect general Doji pattern (indecision).
     :param candle: The candlestick to evaluate
     :param max_body_ratio: Maximum body-to-total-length ratio
     :ref: Nison p. 38
     """
-    return _valid_candle(candle) and is_thin_enough(candle, max_body_ratio)
+    return candle.length > 0 and candle.body_ratio <= max_body_ratio
 
 def is_hammer(candle: CandleStick,
-              max_body_ratio: float = 0.25,
-              min_lower_wick_to_body: float = 2.0,
-              max_upper_wick_ratio: float = 0.33) -> bool:
+              max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+              min_lower_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+              max_upper_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> bool:
     """Detect Hammer pattern (bullish reversal after downtrend).
     :param candle: The candlestick to evaluate
     :param max_body_ratio: Maximum body-to-total-length ratio
@@ -108,16 +108,17 @@ def is_hammer(candle: CandleStick,
     :param max_upper_wick_ratio: Maximum allowed upper wick as fraction of total length
     :ref: Nison p. 27
     """
-    if not _valid_candle(candle):
+    length = candle.length
+    if not length > 0:
         return False
-    return (is_thin_enough(candle, max_body_ratio)
+    return (candle.body_ratio <= max_body_ratio
             and candle.bottom_wick >= candle.body_length * min_lower_wick_to_body
-            and candle.top_wick <= max_upper_wick_ratio * candle.length)
+            and candle.top_wick <= max_upper_wick_ratio * length)
 
 def is_shooting_star(candle: CandleStick,
-                     max_body_ratio: float = 0.25,
-                     min_upper_wick_to_body: float = 2.0,
-                     max_lower_wick_ratio: float = 0.33) -> bool:
+                     max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     min_upper_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     max_lower_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> bool:
     """Detect Shooting Star pattern (bearish reversal after uptrend).
     :param candle: The candlestick to evaluate
     :param max_body_ratio: Maximum body-to-total-length ratio
@@ -125,34 +126,181 @@ def is_shooting_star(candle: CandleStick,
     :param max_lower_wick_ratio: Maximum allowed lower wick as fraction of total length
     :ref: Nison p. 28
     """
-    if not _valid_candle(candle):
+    length = candle.length
+    if not length > 0:
         return False
-    return (is_thin_enough(candle, max_body_ratio)
+    return (candle.body_ratio <= max_body_ratio
             and candle.top_wick >= candle.body_length * min_upper_wick_to_body
-            and candle.bottom_wick <= max_lower_wick_ratio * candle.length)
+            and candle.bottom_wick <= max_lower_wick_ratio * length)
 
-def is_bullish_belt_hold(candle: CandleStick, min_body_ratio: float = 0.95) -> bool:
+def is_bullish_belt_hold(candle: CandleStick, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> bool:
     """Detect Bullish Belt Hold.
     :param candle: The candlestick to evaluate
     :param min_body_ratio: Minimum body-to-total-length ratio
     :ref: Nison p. 32
     """
-    if not _valid_candle(candle) or not candle.is_bullish:
+    if not (candle.length > 0 and candle.is_bullish):
         return False
     # No lower shadow (open = low)
     # Close near high
-    return (is_thick_enough(candle, min_body_ratio)
-            and _rel_close(candle.open, candle.low, abs_tol=1e-5)
-            and _rel_close(candle.close, candle.high, abs_tol=1e-5))
+    return (candle.body_ratio >= min_body_ratio
+            and isclose(candle.open, candle.low, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL)
+            and isclose(candle.close, candle.high, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL))
 
-def is_bearish_belt_hold(candle: CandleStick, min_body_ratio: float = 0.95) -> bool:
+def is_bearish_belt_hold(candle: CandleStick, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> bool:
     """Detect Bearish Belt Hold.
     :param candle: The candlestick to evaluate
     :param min_body_ratio: Minimum body-to-total-length ratio
     :ref: Nison p. 32
     """
-    if not _valid_candle(candle) or candle.is_bullish:
+    if not candle.length > 0 or candle.is_bullish:
         return False
-    return (is_thick_enough(candle, min_body_ratio)
-            and _rel_close(candle.open, candle.high, abs_tol=1e-5)
-            and _rel_close(candle.close, candle.low, abs_tol=1e-5))
\ No newline at end of file
+    return (candle.body_ratio >= min_body_ratio
+            and isclose(candle.open, candle.high, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL)
+            and isclose(candle.close, candle.low, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL))
+
+# --------------------------
+# BOUND THRESHOLDS (one-argument predicates with thresholds fixed per strategy)
+# --------------------------
+
+def make_patterns(doji_max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO,
+                  max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                  min_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                  max_opposite_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                  belt_hold_min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> SimpleNamespace:
+    """Build single-argument pattern predicates with thresholds bound as default arguments.
+    A convenience for code that expects ``f(candle)`` callbacks, e.g. ``filter``/``map``;
+    not a speedup: the closures measure no faster than calling the ``is_*`` functions.
+    :param doji_max_body_ratio: Doji maximum body-to-total-length ratio
+    :param max_body_ratio: Hammer/Shooting Star maximum body-to-total-length ratio
+    :param min_wick_to_body: Hammer/Shooting Star minimum long-wick to body ratio
+    :param max_opposite_wick_ratio: Hammer/Shooting Star maximum short wick as fraction of length
+    :param belt_hold_min_body_ratio: Belt Hold minimum body-to-total-length ratio
+    :return: Namespace with ``is_doji``, ``is_hammer``, ``is_shooting_star``,
+        ``is_bullish_belt_hold`` and ``is_bearish_belt_hold`` taking a single candle
+    """
+    def doji(candle: CandleStick, _r=doji_max_body_ratio) -> bool:
+        return candle.length > 0 and candle.body_ratio <= _r
+
+    def hammer(candle: CandleStick, _r=max_body_ratio, _w=min_wick_to_body,
+               _o=max_opposite_wick_ratio) -> bool:
+        length = candle.length
+        return (length > 0
+                and candle.body_ratio <= _r
+                and candle.bottom_wick >= candle.body_length * _w
+                and candle.top_wick <= _o * length)
+
+    def shooting_star(candle: CandleStick, _r=max_body_ratio, _w=min_wick_to_body,
+                      _o=max_opposite_wick_ratio) -> bool:
+        length = candle.length
+        return (length > 0
+                and candle.body_ratio <= _r
+                and candle.top_wick >= candle.body_length * _w
+                and candle.bottom_wick <= _o * length)
+
+    def bullish_belt_hold(candle: CandleStick, _r=belt_hold_min_body_ratio) -> bool:
+        return (candle.length > 0 and candle.is_bullish
+                and candle.body_ratio >= _r
+                and isclose(candle.open, candle.low, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL)
+                and isclose(candle.close, candle.high, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL))
+
+    def bearish_belt_hold(candle: CandleStick, _r=belt_hold_min_body_ratio) -> bool:
+        return (candle.length > 0 and not candle.is_bullish
+                and candle.body_ratio >= _r
+                and isclose(candle.open, candle.high, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL)
+                and isclose(candle.close, candle.low, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL))
+
+    return SimpleNamespace(is_doji=doji,
+                           is_hammer=hammer,
+                           is_shooting_star=shooting_star,
+                           is_bullish_belt_hold=bullish_belt_hold,
+                           is_bearish_belt_hold=bearish_belt_hold)
+
+# --------------------------
+# SERIES SCANS (boolean mask over every bar of a CandleSeries)
+# --------------------------
+
+def doji_mask(series: CandleSeries, max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO) -> np.ndarray:
+    """Doji mask over a CandleSeries. See :func:`is_doji`."""
+    cols = series.predicate_cache(max_body_ratio=max_body_ratio)
+    return cols['valid'] & cols['thin']
+
+def hammer_mask(series: CandleSeries,
+                max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                min_lower_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                max_upper_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> np.ndarray:
+    """Hammer mask over a CandleSeries. See :func:`is_hammer`."""
+    cols = series.predicate_cache(max_body_ratio=max_body_ratio)
+    mask = cols['valid'] & cols['thin']
+    mask &= series.bottom_wick >= series.scaled('body_length', min_lower_wick_to_body)
+    mask &= series.top_wick <= series.scaled('length', max_upper_wick_ratio)
+    return mask
+
+def shooting_star_mask(series: CandleSeries,
+                       max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                       min_upper_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                       max_lower_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> np.ndarray:
+    """Shooting Star mask over a CandleSeries. See :func:`is_shooting_star`."""
+    cols = series.predicate_cache(max_body_ratio=max_body_ratio)
+    mask = cols['valid'] & cols['thin']
+    mask &= series.top_wick >= series.scaled('body_length', min_upper_wick_to_body)
+    mask &= series.bottom_wick <= series.scaled('length', max_lower_wick_ratio)
+    return mask
+
+def bullish_belt_hold_mask(series: CandleSeries, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> np.ndarray:
+    """Bullish Belt Hold mask over a CandleSeries. See :func:`is_bullish_belt_hold`."""
+    cols = series.predicate_cache(min_body_ratio=min_body_ratio)
+    mask = cols['valid'] & cols['thick_bullish']
+    mask &= series.open_at_low
+    mask &= series.close_at_high
+    return mask
+
+def bearish_belt_hold_mask(series: CandleSeries, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> np.ndarray:
+    """Bearish Belt Hold mask over a CandleSeries. See :func:`is_bearish_belt_hold`."""
+    cols = series.predicate_cache(min_body_ratio=min_body_ratio)
+    mask = cols['valid'] & cols['thick_bearish']
+    mask &= series.open_at_high
+    mask &= series.close_at_low
+    return mask
+
+SCANS = {
+    "doji": doji_mask,
+    "hammer": hammer_mask,
+    "shooting_star": shooting_star_mask,
+    "bullish_belt_hold": bullish_belt_hold_mask,
+    "bearish_belt_hold": bearish_belt_hold_mask,
+}
+
+# Bit of each SCANS pattern in the words returned by scan_pattern_bits
+PATTERN_BITS = {name: 1 << k for k, name in enumerate(SCANS)}
+
+# Combined masks for querying pattern words, e.g. ``(bits & BULLISH_REVERSAL) != 0``
+BULLISH_REVERSAL = PATTERN_BITS["hammer"] | PATTERN_BITS["bullish_belt_hold"]
+BEARISH_REVERSAL = PATTERN_BITS["shooting_star"] | PATTERN_BITS["bearish_belt_hold"]
+INDECISION = PATTERN_BITS["doji"]
+
+def scan_patterns(candles, pattern: str, **thresholds: float) -> np.ndarray:
+    """Evaluate a pattern at every bar in one vectorized pass.
+    :param candles: A CandleSeries, or a sequence of CandleStick converted to one
+    :param pattern: Key of ``SCANS``, e.g. ``"hammer"``
+    :param thresholds: Keyword thresholds of the matching ``*_mask`` function
+    :return: Boolean mask aligned with the input bars
+    """
+    try:
+        scan = SCANS[pattern]
+    except KeyError:
+        raise ValueError(f"Unknown pattern: {pattern!r}") from None
+    if not isinstance(candles, CandleSeries):
+        candles = CandleSeries.from_arrays([c.open for c in candles], [c.high for c in candles],
+                                           [c.low for c in candles], [c.close for c in candles])
+    return scan(candles, **thresholds)
+
+def scan_pattern_bits(series: CandleSeries) -> np.ndarray:
+    """Evaluate every pattern in ``SCANS`` (default thresholds) and pack the results.
+    :param series: The candle series to evaluate
+    :return: uint64 per bar; test a pattern with ``bits & PATTERN_BITS[name]``
+    """
+    bits = np.zeros(len(series), dtype=np.uint64)
+    for k, scan in enumerate(SCANS.values()):
+        bits |= scan(series).astype(np.uint64) << k
+    return bits
@@ -0,0 +1,201 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython scans of the candlestick predicates over contiguous float64 OHLC arrays.
+
+Ahead-of-time alternative to the Numba scanners in ``_kernels`` for deployments
+that cannot afford JIT warmup. Build in place with ``cythonize -i patterns_cy.pyx``.
+Every ``scan_*`` mirrors its ``_kernels`` counterpart and returns a boolean mask;
+``scan_pattern_bits`` fuses all of them into one pass over the bars.
+"""
+import numpy as np
+from cython.parallel cimport prange
+from libc.math cimport fabs, isinf
+from libc.stdint cimport uint64_t
+
+from .entity import (DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                     DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+                     PRICE_REL_TOL as _PRICE_REL_TOL, PRICE_ABS_TOL as _PRICE_ABS_TOL)
+from .patterns import PATTERN_BITS
+
+# Thresholds compiled into the nogil loops; mirror the DEFAULT_* constants in ``entity``.
+cdef double DOJI_MAX_BODY_RATIO = 0.1
+cdef double HAMMER_MAX_BODY_RATIO = 0.25
+cdef double HAMMER_MIN_WICK_TO_BODY = 2.0
+cdef double HAMMER_MAX_OPPOSITE_WICK_RATIO = 0.33
+cdef double BELT_HOLD_MIN_BODY_RATIO = 0.95
+# Price tolerance of _close; mirrors ``entity.PRICE_REL_TOL``/``PRICE_ABS_TOL``.
+cdef double PRICE_REL_TOL = 1e-4
+cdef double PRICE_ABS_TOL = 1e-5
+
+# Bits of the words written by scan_pattern_bits; mirror ``patterns.PATTERN_BITS``.
+cdef enum:
+    BIT_DOJI = 1 << 0
+    BIT_HAMMER = 1 << 1
+    BIT_SHOOTING_STAR = 1 << 2
+    BIT_BULLISH_BELT_HOLD = 1 << 3
+    BIT_BEARISH_BELT_HOLD = 1 << 4
+
+# Fail at import rather than return words that disagree with the Python scans.
+# Explicit raises, not asserts, so the checks also run under ``python -O``.
+if (DOJI_MAX_BODY_RATIO, HAMMER_MAX_BODY_RATIO, HAMMER_MIN_WICK_TO_BODY,
+        HAMMER_MAX_OPPOSITE_WICK_RATIO, BELT_HOLD_MIN_BODY_RATIO, PRICE_REL_TOL, PRICE_ABS_TOL) != (
+        DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO, DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+        DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO, DEFAULT_BELT_HOLD_MIN_BODY_RATIO,
+        _PRICE_REL_TOL, _PRICE_ABS_TOL):
+    raise ImportError("patterns_cy thresholds are out of sync with entity.DEFAULT_* and PRICE_*_TOL; "
+                      "rebuild patterns_cy")
+if PATTERN_BITS != {
+        "doji": BIT_DOJI,
+        "hammer": BIT_HAMMER,
+        "shooting_star": BIT_SHOOTING_STAR,
+        "bullish_belt_hold": BIT_BULLISH_BELT_HOLD,
+        "bearish_belt_hold": BIT_BEARISH_BELT_HOLD}:
+    raise ImportError("patterns_cy bit layout is out of sync with patterns.PATTERN_BITS; "
+                      "rebuild patterns_cy")
+
+
+cdef inline bint _close(double a, double b) noexcept nogil:
+    """Same tolerance rule as ``math.isclose(a, b, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL)``."""
+    if a == b:
+        return True
+    if isinf(a) or isinf(b):
+        return False
+    cdef double fa = fabs(a), fb = fabs(b)
+    cdef double tol = PRICE_REL_TOL * (fa if fa > fb else fb)
+    if tol < PRICE_ABS_TOL:
+        tol = PRICE_ABS_TOL
+    return fabs(a - b) <= tol
+
+
+def scan_doji(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c,
+              double max_body_ratio=DOJI_MAX_BODY_RATIO):
+    """Boolean mask of Doji bars over OHLC arrays."""
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length
+    out = np.zeros(n, dtype=np.bool_)
+    cdef unsigned char[::1] res = out.view(np.uint8)
+    with nogil:
+        for i in range(n):
+            length = h[i] - l[i]
+            res[i] = length > 0 and fabs(c[i] - o[i]) / length <= max_body_ratio
+    return out
+
+
+def scan_hammer(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c,
+                double max_body_ratio=HAMMER_MAX_BODY_RATIO,
+                double min_lower_wick_to_body=HAMMER_MIN_WICK_TO_BODY,
+                double max_upper_wick_ratio=HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Boolean mask of Hammer bars over OHLC arrays."""
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length, body, lo, hi
+    out = np.zeros(n, dtype=np.bool_)
+    cdef unsigned char[::1] res = out.view(np.uint8)
+    with nogil:
+        for i in range(n):
+            length = h[i] - l[i]
+            if length <= 0:
+                continue
+            body = fabs(c[i] - o[i])
+            lo = o[i] if o[i] < c[i] else c[i]
+            hi = o[i] if o[i] > c[i] else c[i]
+            res[i] = (lo - l[i] >= body * min_lower_wick_to_body
+                      and h[i] - hi <= max_upper_wick_ratio * length
+                      and body / length <= max_body_ratio)
+    return out
+
+
+def scan_shooting_star(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c,
+                       double max_body_ratio=HAMMER_MAX_BODY_RATIO,
+                       double min_upper_wick_to_body=HAMMER_MIN_WICK_TO_BODY,
+                       double max_lower_wick_ratio=HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Boolean mask of Shooting Star bars over OHLC arrays."""
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length, body, lo, hi
+    out = np.zeros(n, dtype=np.bool_)
+    cdef unsigned char[::1] res = out.view(np.uint8)
+    with nogil:
+        for i in range(n):
+            length = h[i] - l[i]
+            if length <= 0:
+                continue
+            body = fabs(c[i] - o[i])
+            lo = o[i] if o[i] < c[i] else c[i]
+            hi = o[i] if o[i] > c[i] else c[i]
+            res[i] = (h[i] - hi >= body * min_upper_wick_to_body
+                      and lo - l[i] <= max_lower_wick_ratio * length
+                      and body / length <= max_body_ratio)
+    return out
+
+
+def scan_bullish_belt_hold(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c,
+                           double min_body_ratio=BELT_HOLD_MIN_BODY_RATIO):
+    """Boolean mask of Bullish Belt Hold bars over OHLC arrays."""
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length
+    out = np.zeros(n, dtype=np.bool_)
+    cdef unsigned char[::1] res = out.view(np.uint8)
+    with nogil:
+        for i in range(n):
+            length = h[i] - l[i]
+            if length <= 0 or c[i] <= o[i]:
+                continue
+            res[i] = (_close(o[i], l[i]) and _close(c[i], h[i])
+                      and (c[i] - o[i]) / length >= min_body_ratio)
+    return out
+
+
+def scan_bearish_belt_hold(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c,
+                           double min_body_ratio=BELT_HOLD_MIN_BODY_RATIO):
+    """Boolean mask of Bearish Belt Hold bars over OHLC arrays."""
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length
+    out = np.zeros(n, dtype=np.bool_)
+    cdef unsigned char[::1] res = out.view(np.uint8)
+    with nogil:
+        for i in range(n):
+            length = h[i] - l[i]
+            if length <= 0 or c[i] > o[i]:
+                continue
+            res[i] = (_close(o[i], h[i]) and _close(c[i], l[i])
+                      and (o[i] - c[i]) / length >= min_body_ratio)
+    return out
+
+
+def scan_pattern_bits(const double[::1] o, const double[::1] h, const double[::1] l, const double[::1] c):
+    """Every pattern, with default thresholds, packed into one uint64 per bar.
+
+    Bit layout matches ``patterns.PATTERN_BITS`` (checked at import). Bars are independent, so the
+    loop runs under ``prange`` and uses OpenMP threads when built with it.
+    """
+    cdef Py_ssize_t i, n = o.shape[0]
+    cdef double length, body, br, lo, hi, top, bot
+    cdef uint64_t bits
+    out = np.zeros(n, dtype=np.uint64)
+    cdef uint64_t[::1] res = out
+    for i in prange(n, nogil=True):
+        length = h[i] - l[i]
+        if length > 0:
+            body = fabs(c[i] - o[i])
+            br = body / length
+            lo = o[i] if o[i] < c[i] else c[i]
+            hi = o[i] if o[i] > c[i] else c[i]
+            top = h[i] - hi
+            bot = lo - l[i]
+            bits = BIT_DOJI if br <= DOJI_MAX_BODY_RATIO else 0
+            if br <= HAMMER_MAX_BODY_RATIO:
+                if (bot >= body * HAMMER_MIN_WICK_TO_BODY
+                        and top <= HAMMER_MAX_OPPOSITE_WICK_RATIO * length):
+                    bits = bits | BIT_HAMMER
+                if (top >= body * HAMMER_MIN_WICK_TO_BODY
+                        and bot <= HAMMER_MAX_OPPOSITE_WICK_RATIO * length):
+                    bits = bits | BIT_SHOOTING_STAR
+            if br >= BELT_HOLD_MIN_BODY_RATIO:
+                if c[i] > o[i]:
+                    if _close(o[i], l[i]) and _close(c[i], h[i]):
+                        bits = bits | BIT_BULLISH_BELT_HOLD
+                elif _close(o[i], h[i]) and _close(c[i], l[i]):
+                    bits = bits | BIT_BEARISH_BELT_HOLD
+            res[i] = bits
+    return out
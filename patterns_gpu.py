@@ -0,0 +1,99 @@
+"""
+Array-namespace pattern scans that run on the GPU via CuPy.
+
+Every ``scan_*`` function is pure elementwise ufunc arithmetic, so it runs
+unchanged on ``numpy.ndarray`` (CPU) or ``cupy.ndarray`` (GPU) inputs; the
+namespace is picked from the arrays passed in. Inputs may be 1-D
+``(n_bars,)`` or stacked 2-D ``(n_symbols, n_bars)`` to scan many symbols at
+once. Masks are returned on the same device as the inputs.
+"""
+import numpy as np
+
+from .entity import (DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                     DEFAULT_BELT_HOLD_MIN_BODY_RATIO, PRICE_REL_TOL, PRICE_ABS_TOL)
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without cupy
+    cp = None
+    CUPY_AVAILABLE = False
+
+
+def _xp(arr):
+    """Array module (numpy or cupy) owning ``arr``."""
+    return cp.get_array_module(arr) if CUPY_AVAILABLE else np
+
+def _geometry(xp, O, H, L, C):
+    """Shared per-bar geometry: validity, body length, range, body ratio, wicks."""
+    length = H - L
+    valid = length > 0
+    body = xp.abs(C - O)
+    body_ratio = body / xp.where(valid, length, 1.0)
+    top_wick = H - xp.maximum(O, C)
+    bottom_wick = xp.minimum(O, C) - L
+    return valid, body, length, body_ratio, top_wick, bottom_wick
+
+def _close(xp, a, b, rel_tol=PRICE_REL_TOL, abs_tol=PRICE_ABS_TOL):
+    diff = xp.abs(a - b)
+    # As in math.isclose, an infinite price is close only to itself
+    return (((diff <= xp.maximum(rel_tol * xp.maximum(xp.abs(a), xp.abs(b)), abs_tol))
+             & xp.isfinite(diff)) | (a == b))
+
+def scan_doji(O, H, L, C, max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO):
+    """Doji mask. See :func:`patterns.is_doji`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    """
+    xp = _xp(O)
+    valid, _, _, body_ratio, _, _ = _geometry(xp, O, H, L, C)
+    return valid & (body_ratio <= max_body_ratio)
+
+def scan_hammer(O, H, L, C,
+                max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                min_lower_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                max_upper_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Hammer mask. See :func:`patterns.is_hammer`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    :param min_lower_wick_to_body: Minimum required ratio of lower wick to body length
+    :param max_upper_wick_ratio: Maximum allowed upper wick as fraction of total length
+    """
+    xp = _xp(O)
+    valid, body, length, body_ratio, top_wick, bottom_wick = _geometry(xp, O, H, L, C)
+    return (valid & (body_ratio <= max_body_ratio)
+            & (bottom_wick >= body * min_lower_wick_to_body)
+            & (top_wick <= max_upper_wick_ratio * length))
+
+def scan_shooting_star(O, H, L, C,
+                       max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                       min_upper_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                       max_lower_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO):
+    """Shooting Star mask. See :func:`patterns.is_shooting_star`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    :param min_upper_wick_to_body: Minimum required ratio of upper wick to body length
+    :param max_lower_wick_ratio: Maximum allowed lower wick as fraction of total length
+    """
+    xp = _xp(O)
+    valid, body, length, body_ratio, top_wick, bottom_wick = _geometry(xp, O, H, L, C)
+    return (valid & (body_ratio <= max_body_ratio)
+            & (top_wick >= body * min_upper_wick_to_body)
+            & (bottom_wick <= max_lower_wick_ratio * length))
+
+def scan_bullish_belt_hold(O, H, L, C, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO):
+    """Bullish Belt Hold mask. See :func:`patterns.is_bullish_belt_hold`.
+    :param min_body_ratio: Minimum body-to-total-length ratio
+    """
+    xp = _xp(O)
+    valid, _, _, body_ratio, _, _ = _geometry(xp, O, H, L, C)
+    return (valid & (C > O) & (body_ratio >= min_body_ratio)
+            & _close(xp, O, L) & _close(xp, C, H))
+
+def scan_bearish_belt_hold(O, H, L, C, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO):
+    """Bearish Belt Hold mask. See :func:`patterns.is_bearish_belt_hold`.
+    :param min_body_ratio: Minimum body-to-total-length ratio
+    """
+    xp = _xp(O)
+    valid, _, _, body_ratio, _, _ = _geometry(xp, O, H, L, C)
+    return (valid & (C <= O) & (body_ratio >= min_body_ratio)
+            & _close(xp, O, H) & _close(xp, C, L))
@@ -0,0 +1,69 @@
+"""
+Vectorized pattern predicates over columnar OHLC arrays.
+
+Each ``is_*_vec`` takes open/high/low/close arrays and returns a boolean mask
+with one entry per bar. Geometry is computed once per call through a
+``CandleSeries``; callers screening several patterns over the same history
+should build the series once and use the ``*_mask`` functions in ``patterns``
+directly so the derived columns are shared, or call ``detect_all`` to get every
+pattern from one series.
+"""
+import numpy as np
+
+from .entity import (CandleSeries, DEFAULT_DOJI_MAX_BODY_RATIO, DEFAULT_HAMMER_MAX_BODY_RATIO,
+                     DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                     DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO,
+                     DEFAULT_BELT_HOLD_MIN_BODY_RATIO)
+from .patterns import (SCANS, doji_mask, hammer_mask, shooting_star_mask,
+                       bullish_belt_hold_mask, bearish_belt_hold_mask)
+
+
+def is_doji_vec(o, h, l, c, max_body_ratio: float = DEFAULT_DOJI_MAX_BODY_RATIO) -> np.ndarray:
+    """Vectorized :func:`patterns.is_doji`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    """
+    return doji_mask(CandleSeries.from_arrays(o, h, l, c), max_body_ratio)
+
+def is_hammer_vec(o, h, l, c,
+                  max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                  min_lower_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                  max_upper_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> np.ndarray:
+    """Vectorized :func:`patterns.is_hammer`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    :param min_lower_wick_to_body: Minimum required ratio of lower wick to body length
+    :param max_upper_wick_ratio: Maximum allowed upper wick as fraction of total length
+    """
+    return hammer_mask(CandleSeries.from_arrays(o, h, l, c),
+                       max_body_ratio, min_lower_wick_to_body, max_upper_wick_ratio)
+
+def is_shooting_star_vec(o, h, l, c,
+                         max_body_ratio: float = DEFAULT_HAMMER_MAX_BODY_RATIO,
+                         min_upper_wick_to_body: float = DEFAULT_HAMMER_MIN_WICK_TO_BODY,
+                         max_lower_wick_ratio: float = DEFAULT_HAMMER_MAX_OPPOSITE_WICK_RATIO) -> np.ndarray:
+    """Vectorized :func:`patterns.is_shooting_star`.
+    :param max_body_ratio: Maximum body-to-total-length ratio
+    :param min_upper_wick_to_body: Minimum required ratio of upper wick to body length
+    :param max_lower_wick_ratio: Maximum allowed lower wick as fraction of total length
+    """
+    return shooting_star_mask(CandleSeries.from_arrays(o, h, l, c),
+                              max_body_ratio, min_upper_wick_to_body, max_lower_wick_ratio)
+
+def is_bullish_belt_hold_vec(o, h, l, c, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> np.ndarray:
+    """Vectorized :func:`patterns.is_bullish_belt_hold`.
+    :param min_body_ratio: Minimum body-to-total-length ratio
+    """
+    return bullish_belt_hold_mask(CandleSeries.from_arrays(o, h, l, c), min_body_ratio)
+
+def is_bearish_belt_hold_vec(o, h, l, c, min_body_ratio: float = DEFAULT_BELT_HOLD_MIN_BODY_RATIO) -> np.ndarray:
+    """Vectorized :func:`patterns.is_bearish_belt_hold`.
+    :param min_body_ratio: Minimum body-to-total-length ratio
+    """
+    return bearish_belt_hold_mask(CandleSeries.from_arrays(o, h, l, c), min_body_ratio)
+
+def detect_all(o, h, l, c) -> dict[str, np.ndarray]:
+    """Evaluate every pattern in ``patterns.SCANS`` (default thresholds) over one shared series.
+    Geometry columns and feature bits are computed once and reused by every mask.
+    :return: Mapping of pattern name to boolean mask
+    """
+    series = CandleSeries.from_arrays(o, h, l, c)
+    return {name: scan(series) for name, scan in SCANS.items()}
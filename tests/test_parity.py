@@ -0,0 +1,248 @@
+"""
+Parity of every pattern implementation against the scalar ``CandleStick`` API.
+
+The scalar ``is_*`` predicates in ``patterns`` are the reference. Each other path
+(``*_mask`` scans, Numba scanners/ufuncs/fused kernels, the
+array-namespace scans, ``patterns_vec`` and, when built, ``patterns_cy``) must
+flag exactly the same bars on random OHLC data that includes NaN, infinite and
+zero-range bars.
+"""
+import importlib
+import inspect
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The repository root is itself the package (modules use relative imports).
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT.parent))
+
+
+def _module(name):
+    return importlib.import_module(f"{_ROOT.name}.{name}")
+
+
+entity = _module("entity")
+P = _module("patterns")
+K = _module("_kernels")
+G = _module("patterns_gpu")
+V = _module("patterns_vec")
+
+NAMES = list(P.SCANS)
+
+
+def _defaults(name):
+    """Default thresholds of the scalar predicate, in signature order."""
+    params = list(inspect.signature(getattr(P, "is_" + name)).parameters.values())[1:]
+    return tuple(p.default for p in params)
+
+
+def _ufunc_args(name):
+    """Positional thresholds of the ``*_u`` ufunc: the defaults plus any price tolerances."""
+    if name.endswith("belt_hold"):
+        return _defaults(name) + (entity.PRICE_REL_TOL, entity.PRICE_ABS_TOL)
+    return _defaults(name)
+
+
+def _ohlc(n, seed=0, missing=0.02):
+    rng = np.random.default_rng(seed)
+    o = 100 + rng.normal(0, 1, n).cumsum()
+    c = o + rng.normal(0, 0.5, n)
+    h = np.maximum(o, c) + np.abs(rng.normal(0, 0.4, n)) * (rng.random(n) > 0.3)
+    l = np.minimum(o, c) - np.abs(rng.normal(0, 0.4, n)) * (rng.random(n) > 0.3)
+    # Exact belt holds and zero-range bars
+    c[::50] = h[::50]
+    o[::50] = l[::50]
+    h[::97] = l[::97] = o[::97] = c[::97]
+    for col in (o, h, l, c):
+        col[rng.random(n) < missing] = np.nan
+        col[rng.random(n) < missing / 10] = np.inf
+        col[rng.random(n) < missing / 10] = -np.inf
+    return o, h, l, c
+
+
+def _reference(name, o, h, l, c, *thresholds):
+    pred = getattr(P, "is_" + name)
+    return np.array([pred(entity.CandleStick.from_ohlc(*bar), *thresholds)
+                     for bar in zip(o, h, l, c)], dtype=bool)
+
+
+@pytest.fixture(scope="module")
+def bars():
+    o, h, l, c = _ohlc(5000)
+    ref = {name: _reference(name, o, h, l, c) for name in NAMES}
+    return o, h, l, c, ref
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("name", NAMES)
+def test_python_paths(bars, name):
+    o, h, l, c, refs = bars
+    ref = refs[name]
+    series = entity.CandleSeries.from_arrays(o, h, l, c)
+    candles = [series.slice(i) for i in range(len(series))]
+    bound = getattr(P.make_patterns(), "is_" + name)
+
+    assert [bound(candle) for candle in candles] == ref.tolist()
+    assert (P.SCANS[name](series) == ref).all()
+    assert (P.scan_patterns(candles, name) == ref).all()
+    assert (((P.scan_pattern_bits(series) & P.PATTERN_BITS[name]) != 0) == ref).all()
+    assert (getattr(V, "is_" + name + "_vec")(o, h, l, c) == ref).all()
+    assert (V.detect_all(o, h, l, c)[name] == ref).all()
+    assert (getattr(G, "scan_" + name)(o, h, l, c) == ref).all()
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("name", NAMES)
+def test_compiled_paths(bars, name):
+    o, h, l, c, refs = bars
+    ref = refs[name]
+    assert (getattr(K, "scan_" + name)(o, h, l, c) == ref).all()
+    assert (getattr(K, name + "_u")(o, h, l, c, *_ufunc_args(name)) == ref).all()
+    assert (K.scan_all(o, h, l, c)[name] == ref).all()
+    assert (K.make_scanner(name)(o, h, l, c) == ref).all()
+    mirror = K.scan_mirror_pairs(o, h, l, c)
+    if name in mirror:
+        assert (mirror[name] == ref).all()
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("name", NAMES)
+def test_cython_paths(bars, name):
+    cy = pytest.importorskip(f"{_ROOT.name}.patterns_cy")
+    o, h, l, c, refs = bars
+    ref = refs[name]
+    assert (getattr(cy, "scan_" + name)(o, h, l, c) == ref).all()
+    assert (((cy.scan_pattern_bits(o, h, l, c) & P.PATTERN_BITS[name]) != 0) == ref).all()
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 33])
+def test_short_arrays(n):
+    # Compiled loops take different code paths for short inputs
+    o, h, l, c = _ohlc(n, seed=n, missing=0.3)
+    o[0], h[0], l[0], c[0] = np.nan, 2.0, 1.0, 1.9
+    for name in NAMES:
+        ref = _reference(name, o, h, l, c)
+        assert (getattr(K, "scan_" + name)(o, h, l, c) == ref).all(), name
+        assert (getattr(K, name + "_u")(o, h, l, c, *_ufunc_args(name)) == ref).all(), name
+        assert (K.scan_all(o, h, l, c)[name] == ref).all(), name
+        assert (P.SCANS[name](entity.CandleSeries.from_arrays(o, h, l, c)) == ref).all(), name
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_custom_thresholds(bars):
+    o, h, l, c, _ = bars
+    series = entity.CandleSeries.from_arrays(o, h, l, c)
+    ref = _reference("hammer", o, h, l, c, 0.3, 1.5, 0.2)
+    assert (P.hammer_mask(series, 0.3, 1.5, 0.2) == ref).all()
+    assert (K.scan_hammer(o, h, l, c, 0.3, 1.5, 0.2) == ref).all()
+    assert (K.make_scanner("hammer", max_body_ratio=0.3, min_lower_wick_to_body=1.5,
+                           max_upper_wick_ratio=0.2)(o, h, l, c) == ref).all()
+    ref = _reference("bearish_belt_hold", o, h, l, c, 0.9)
+    assert (P.bearish_belt_hold_mask(series, 0.9) == ref).all()
+    assert (K.scan_mirror_pairs(o, h, l, c, min_belt_body_ratio=0.9)["bearish_belt_hold"] == ref).all()
+    ref = _reference("doji", o, h, l, c, 0.05)
+    assert (P.scan_patterns(series, "doji", max_body_ratio=0.05) == ref).all()
+    assert (P.make_patterns(doji_max_body_ratio=0.05).is_doji(series.slice(0))
+            == bool(ref[0]))
+
+
+def test_nan_close_is_not_a_pattern():
+    candle = entity.CandleStick.from_ohlc(1.95, 2.0, 0.9, float("nan"))
+    assert not P.is_doji(candle)
+    assert not P.is_hammer(candle)
+
+
+def test_cached_columns_are_read_only():
+    series = entity.CandleSeries.from_arrays([1.0, 2.0], [2.0, 3.0], [0.5, 1.5], [1.5, 2.5])
+    with pytest.raises(ValueError):
+        series.predicate_cache()["thin"][0] = True
+    with pytest.raises(ValueError):
+        series.feature_bits()[0] = 0
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf, -np.inf])
+def test_fixed_rejects_non_finite_prices(bad):
+    with pytest.raises(ValueError, match="finite"):
+        entity.CandleSeriesFixed.from_arrays([1.0, 1.0], [2.0, bad], [0.5, 0.5], [1.5, 1.5])
+
+
+def _grid_ohlc(n, tick_size, seed=0):
+    """Finite OHLC on an exact power-of-two tick grid, so ticks and prices convert losslessly."""
+    o, h, l, c = _ohlc(n, seed=seed, missing=0)
+    return tuple(np.rint(col / tick_size) * tick_size for col in (o, h, l, c))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_fixed_and_float32_series(name):
+    tick_size = 2.0 ** -6
+    o, h, l, c = _grid_ohlc(5000, tick_size)
+    ref = _reference(name, o, h, l, c)
+
+    fixed = entity.CandleSeriesFixed.from_arrays(o, h, l, c, tick_size=tick_size)
+    assert fixed.open.dtype == np.int32 and fixed.length.dtype == np.int32
+    assert (P.SCANS[name](fixed) == ref).all()
+
+    ticks = entity.CandleSeriesFixed.from_ticks(fixed.open.astype(np.int64), fixed.high,
+                                                fixed.low, fixed.close, tick_size)
+    assert ticks.open.dtype == np.int32
+    assert (P.SCANS[name](ticks) == ref).all()
+    assert ticks.slice(3).open == o[3]
+
+    f32 = entity.CandleSeries.from_arrays(o, h, l, c, dtype=np.float32)
+    assert f32.body_ratio.dtype == np.float32 and f32.top_wick.dtype == np.float32
+    assert (P.SCANS[name](f32) == ref).all()
+
+
+def test_fixed_body_average_does_not_wrap():
+    # 150k at the default 1e-4 tick is 1.5e9 ticks; open + close exceeds int32
+    fixed = entity.CandleSeriesFixed.from_arrays([150000.0], [150010.0], [149990.0], [150005.0])
+    assert fixed.body_average[0] * fixed.tick_size == pytest.approx(150002.5)
+
+
+def test_from_ticks_validation():
+    with pytest.raises(TypeError):
+        entity.CandleSeriesFixed.from_ticks([1.5], [2.0], [1.0], [1.5], 1e-4)
+    with pytest.raises(ValueError):
+        entity.CandleSeriesFixed.from_ticks([2 ** 40], [2 ** 40], [1], [1], 1e-4)
+    with pytest.raises(ValueError):
+        entity.CandleSeriesFixed.from_arrays([1e6], [1e6], [1e6], [1e6])
+
+
+def test_candlestick_is_immutable():
+    candle = entity.CandleStick.from_ohlc(1.0, 2.0, 0.5, 1.5)
+    with pytest.raises(AttributeError):
+        candle.close = 1.9
+    assert type(candle) is entity.CandleStick
+    assert (candle.close, candle.body_length, candle.top_wick) == (1.5, 0.5, 0.5)
+
+
+def test_relation_columns():
+    # Finite prices: the series body columns propagate NaN where CandleStick falls back to open
+    o, h, l, c = _ohlc(2000, seed=1, missing=0)
+    series = entity.CandleSeries.from_arrays(o, h, l, c)
+    candles = [entity.CandleStick.from_ohlc(*bar) for bar in zip(o, h, l, c)]
+    pairs = list(zip(candles[:-1], candles[1:]))
+    for name in ("gap_up", "gap_down", "body_engulf", "wick_engulf"):
+        ref = [False] + [getattr(P, name)(prev, curr) for prev, curr in pairs]
+        assert getattr(series, name).tolist() == ref, name
+    ref = [False] + [P.body_contained(curr, prev) for prev, curr in pairs]
+    assert series.body_contained.tolist() == ref
+
+    cols = series.predicate_cache()
+    assert (cols["gap_up"] == series.gap_up).all() and (cols["gap_down"] == series.gap_down).all()
+    bits = series.feature_bits()
+    assert (((bits & entity.FEATURE_GAP_UP) != 0) == series.gap_up).all()
+    assert (((bits & entity.FEATURE_GAP_DOWN) != 0) == series.gap_down).all()
+
+    ref = [False, False] + [curr.open > prev.close for prev, curr in zip(candles[:-2], candles[2:])]
+    assert series.relation("open", ">", "close", lag=2).tolist() == ref
+    with pytest.raises(ValueError):
+        series.relation("open", "!=", "close")
+    with pytest.raises(ValueError):
+        series.relation("open", ">", "close", lag=0)
+    with pytest.raises(ValueError):
+        series.gap_up[1] = True
@@ -0,0 +1,50 @@
+"""
+Optional Numba support.
+
+Exposes ``njit``, ``prange`` and ``vectorize`` that resolve to Numba when it is
+installed and degrade to a no-op decorator / ``range`` / ``numpy.vectorize``
+otherwise, so kernels stay importable (and correct, just slower) without the
+dependency.
+"""
+
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    from functools import wraps
+
+    import numpy as np
+
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting bare and called forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    def vectorize(signatures, **kwargs):
+        """Stand-in for ``numba.vectorize`` built on ``numpy.vectorize``.
+
+        The output dtype is taken from the return type of the first signature;
+        ``out=`` is honoured by copying into the given buffer.
+        """
+        restype = signatures[0].split("(", 1)[0].strip()
+        otype = np.bool_ if restype == "boolean" else np.dtype(restype)
+
+        def decorator(func):
+            vfunc = np.vectorize(func, otypes=[otype])
+
+            @wraps(func)
+            def wrapper(*args, out=None):
+                result = vfunc(*args)
+                if out is None:
+                    return result
+                out[...] = result
+                return out
+            return wrapper
+        return decorator